@@ -11,11 +11,14 @@ Tolstoy stilinde metin üretimi yapar.
 - Gerçek zamanlı metin üretimi
 """
 
+import gc
 import os
 import json
+import hashlib
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Callable, Dict, Iterator, Tuple
 
 # TensorFlow uyarılarını kapat
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
@@ -23,7 +26,21 @@ os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
 
 import numpy as np
 import streamlit as st
-from tensorflow.keras.models import load_model, Model
+import tensorflow as tf
+from tensorflow.keras import activations
+from tensorflow.keras.layers import LSTM, Activation, Bidirectional, Dense, Softmax
+from tensorflow.keras.models import clone_model, load_model, Model
+
+# batch=1 çıkarımda varsayılan thread havuzu her op'a senkronizasyon maliyeti ekler;
+# thread sayısı TG_THREADS ortam değişkeni ile değiştirilebilir
+NUM_THREADS = int(os.environ.get("TG_THREADS", "1"))
+tf.config.threading.set_intra_op_parallelism_threads(NUM_THREADS)
+tf.config.threading.set_inter_op_parallelism_threads(NUM_THREADS)
+
+try:
+    import numba
+except ImportError:  # Numba opsiyonel bir hızlandırma bağımlılığıdır
+    numba = None
 
 # Logging yapılandırması
 logging.basicConfig(
@@ -33,6 +50,69 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _sample_kernel(logits: np.ndarray, temperature: float, u: float) -> int:
+    """
+    Temperature ölçekleme, softmax ve örneklemeyi tek geçişte yapan kernel
+    
+    Args:
+        logits: Model çıktısı (softmax öncesi logit'ler)
+        temperature: Sampling sıcaklığı
+        u: [0, 1) aralığında uniform rastgele sayı
+    
+    Returns:
+        Seçilen karakterin index'i
+    """
+    n = logits.shape[0]
+    z = np.empty(n, dtype=np.float32)
+    
+    # log-sum-exp: taşmayı önlemek için maksimum değer çıkarılır
+    m = logits[0] / temperature
+    for i in range(n):
+        z[i] = logits[i] / temperature
+        if z[i] > m:
+            m = z[i]
+    
+    total = np.float32(0.0)
+    for i in range(n):
+        z[i] = np.exp(z[i] - m)
+        total += z[i]
+    
+    # Kümülatif toplamda u * total eşiğini geçen ilk index
+    threshold = u * total
+    acc = np.float32(0.0)
+    for i in range(n):
+        acc += z[i]
+        if acc > threshold:
+            return i
+    return n - 1
+
+
+def _file_sha256(path: Path) -> str:
+    """
+    Dosyanın SHA-256 özetini parça parça okuyarak hesaplar
+    
+    Args:
+        path: Özeti alınacak dosyanın yolu
+    
+    Returns:
+        Hex formatında SHA-256 özeti
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Numba varsa kernel float32 logit imzasıyla import sırasında JIT derlenir (SIMD
+# vektörizasyonu için), yoksa NumPy yolu kullanılır. u skaler olduğu için float64
+# kalır; float32'ye yuvarlandığında 1.0 olup her zaman son index'i seçtirebilir.
+_sample_nb = (
+    numba.njit("int64(float32[::1], float32, float64)", cache=True, fastmath=True)(_sample_kernel)
+    if numba is not None else None
+)
+
+
 # =========================
 # CONFIG
 # =========================
@@ -51,6 +131,12 @@ class Config:
     MAX_TEMPERATURE = 1.2
     MIN_LENGTH = 100
     MAX_LENGTH = 800
+    
+    # Cache: tek generator, günde bir yenilenir
+    CACHE_TTL = 24 * 60 * 60
+    
+    # Streaming: arayüz her STREAM_EVERY karakterde bir güncellenir
+    STREAM_EVERY = 10
 
 
 # =========================
@@ -59,59 +145,362 @@ class Config:
 class StreamlitTextGenerator:
     """Streamlit için optimize edilmiş metin üretici sınıfı"""
     
-    def __init__(self, artifacts_dir: Path, seq_length: int = 40):
+    def __init__(self, artifacts_dir: Path, seq_length: int = 40, use_tflite: bool = True):
         """
         Args:
             artifacts_dir: Model ve vocabulary dosyalarının bulunduğu dizin
             seq_length: Girdi sequence uzunluğu
+            use_tflite: model_int8.tflite varsa Keras modeli yerine onu kullan
         """
         self.artifacts_dir = artifacts_dir
         self.seq_length = seq_length
+        self.use_tflite = use_tflite
         
         self.model: Model = None
+        self._graph_fn: Callable[[tf.Tensor], tf.Tensor] = None
+        self._logits_model: Model = None
+        self._logits_dense: Dense = None
+        self._interpreter: tf.lite.Interpreter = None
+        self._input_idx: int = 0
+        self._output_idx: int = 0
+        # Interpreter thread-safe değil; cache'lenen generator oturumlar arasında paylaşılır
+        self._interpreter_lock = threading.Lock()
         self.char_to_idx: Dict[str, int] = {}
-        self.idx_to_char: Dict[int, str] = {}
+        self.idx_to_char: Tuple[str, ...] = ()
         self.vocab_size: int = 0
+        self._lut: np.ndarray = None
+        self._pad_idx: int = 0
     
     def load_model_and_vocab(self) -> None:
         """Model ve vocabulary dosyalarını yükler"""
         try:
-            # Model yükleme
-            model_path = self.artifacts_dir / "best_model.keras"
-            if not model_path.exists():
-                raise FileNotFoundError(f"Model dosyası bulunamadı: {model_path}")
+            # Vocabulary yükleme: vocab.npz (hazır LUT) varsa JSON parse edilmez
+            vocab_path = self.artifacts_dir / "vocab.npz"
+            if vocab_path.exists():
+                self._load_vocab_npz(vocab_path)
+            else:
+                self._load_vocab_json()
             
-            logger.info("Model yükleniyor...")
-            self.model = load_model(model_path)
-            logger.info("Model başarıyla yüklendi")
+            self.vocab_size = len(self.idx_to_char)
+            self._pad_idx = int(self._lut[ord(" ")])
             
-            # Vocabulary yükleme
-            char_to_idx_path = self.artifacts_dir / "char_to_idx.json"
-            idx_to_char_path = self.artifacts_dir / "idx_to_char.json"
-            
-            if not char_to_idx_path.exists() or not idx_to_char_path.exists():
-                raise FileNotFoundError("Vocabulary dosyaları bulunamadı")
-            
-            with open(char_to_idx_path, "r", encoding="utf-8") as f:
-                self.char_to_idx = json.load(f)
+            # Model yükleme: int8 TFLite modeli güncel ve uyumluysa CPU çıkarımı için tercih edilir
+            # (boyut kontrolü için vocabulary önce yüklenir)
+            tflite_path = self.artifacts_dir / "model_int8.tflite"
+            model_path = self.artifacts_dir / "best_model.keras"
             
-            with open(idx_to_char_path, "r", encoding="utf-8") as f:
-                idx_to_char_raw = json.load(f)
-                self.idx_to_char = {int(k): v for k, v in idx_to_char_raw.items()}
+            if self.use_tflite and tflite_path.exists() and self._load_tflite(tflite_path, model_path):
+                logger.info("TFLite modeli başarıyla yüklendi")
+            else:
+                if not model_path.exists():
+                    raise FileNotFoundError(f"Model dosyası bulunamadı: {model_path}")
+                
+                logger.info("Model yükleniyor...")
+                self.model = load_model(model_path)
+                self._ensure_cudnn_compatible()
+                logger.info("Model başarıyla yüklendi")
+                
+                self._build_logits_model()
+                
+                # Sabit input shape ile bir kez trace edilen, logit döndüren forward pass
+                self._graph_fn = tf.function(
+                    self._build_forward_logits(),
+                    input_signature=[tf.TensorSpec((1, self.seq_length), tf.int32)]
+                )
             
-            self.vocab_size = len(self.char_to_idx)
             logger.info(f"Vocabulary yüklendi (boyut: {self.vocab_size})")
             
         except Exception as e:
             logger.error(f"Model yükleme hatası: {e}")
             raise
     
-    def sample_with_temperature(self, predictions: np.ndarray, temperature: float = 1.0) -> int:
+    def _load_vocab_npz(self, vocab_path: Path) -> None:
+        """
+        Vocabulary'yi tek bir .npz dosyasından yükler
+        
+        Dosya, doğrudan kullanılabilen 256 girişli byte -> index LUT'unu
+        ve index -> karakter byte dizisini içerir.
+        
+        Args:
+            vocab_path: vocab.npz dosyasının yolu
+        """
+        with np.load(vocab_path) as vocab:
+            self._lut = vocab["lut"].astype(np.int32)
+            idx2char = vocab["idx2char"].tobytes().decode("latin-1")
+        
+        self.idx_to_char = tuple(idx2char)
+        self.char_to_idx = {ch: i for i, ch in enumerate(self.idx_to_char)}
+    
+    def _load_vocab_json(self) -> None:
+        """Vocabulary'yi char_to_idx.json ve idx_to_char.json dosyalarından yükler"""
+        char_to_idx_path = self.artifacts_dir / "char_to_idx.json"
+        idx_to_char_path = self.artifacts_dir / "idx_to_char.json"
+        
+        if not char_to_idx_path.exists() or not idx_to_char_path.exists():
+            raise FileNotFoundError("Vocabulary dosyaları bulunamadı")
+        
+        with open(char_to_idx_path, "r", encoding="utf-8") as f:
+            self.char_to_idx = json.load(f)
+        
+        with open(idx_to_char_path, "r", encoding="utf-8") as f:
+            idx_to_char_raw = json.load(f)
+        
+        # Index -> karakter için dict yerine tuple: hash'siz O(1) erişim
+        self.idx_to_char = tuple(idx_to_char_raw[str(i)] for i in range(len(idx_to_char_raw)))
+        
+        # Karakter -> index lookup tablosu (sözlükte olmayanlar 0)
+        self._lut = np.zeros(256, dtype=np.int32)
+        for ch, i in self.char_to_idx.items():
+            if ord(ch) < 256:
+                self._lut[ord(ch)] = i
+    
+    def warmup(self) -> None:
+        """
+        Graph tracing ve kernel seçimi maliyetini ilk üretimden önce öder
+        """
+        logits = self.predict(np.zeros((1, self.seq_length), dtype=np.int32))[0]
+        self.sample_with_temperature(logits, 1.0)
+        logger.info("Model ısıtıldı")
+    
+    def _ensure_cudnn_compatible(self) -> None:
+        """
+        LSTM katmanlarının GPU'da cuDNN fused kernel'ini kullanabilmesini sağlar
+        
+        unroll=True veya recurrent_dropout > 0 olan LSTM'ler yavaş, adım adım
+        implementasyona düşer. Bu iki ayar çıkarım sonucunu değiştirmeden
+        kapatılabildiği için model aynı mimariyle yeniden kurulup ağırlıklar
+        aktarılır. Aktivasyon veya bias farkları çıktıyı değiştireceğinden
+        yalnızca uyarı olarak raporlanır.
+        """
+        lstm_layers = []
+        for layer in self.model.layers:
+            if isinstance(layer, Bidirectional):
+                lstm_layers.extend([layer.forward_layer, layer.backward_layer])
+            elif isinstance(layer, LSTM):
+                lstm_layers.append(layer)
+        
+        needs_rebuild = False
+        cudnn_compatible = True
+        for lstm in lstm_layers:
+            if lstm.unroll or lstm.recurrent_dropout > 0:
+                needs_rebuild = True
+            if (
+                lstm.activation is not activations.tanh
+                or lstm.recurrent_activation is not activations.sigmoid
+                or not lstm.use_bias
+            ):
+                cudnn_compatible = False
+                logger.warning(f"{lstm.name}: aktivasyon/bias ayarları cuDNN kernel'i ile uyumsuz")
+        
+        if needs_rebuild:
+            def clone_layer(layer):
+                config = layer.get_config()
+                if isinstance(layer, Bidirectional):
+                    lstm_configs = [config["layer"]["config"]]
+                    if config.get("backward_layer"):
+                        lstm_configs.append(config["backward_layer"]["config"])
+                elif isinstance(layer, LSTM):
+                    lstm_configs = [config]
+                else:
+                    lstm_configs = []
+                for lstm_config in lstm_configs:
+                    lstm_config["unroll"] = False
+                    lstm_config["recurrent_dropout"] = 0.0
+                return layer.__class__.from_config(config)
+            
+            rebuilt = clone_model(self.model, clone_function=clone_layer)
+            rebuilt.set_weights(self.model.get_weights())
+            self.model = rebuilt
+            logger.info("LSTM katmanları cuDNN uyumlu ayarlarla yeniden kuruldu")
+        
+        # Uyumsuz katman varsa GPU'da da genel (yavaş) implementasyon kullanılır
+        if cudnn_compatible and tf.config.list_physical_devices("GPU"):
+            logger.info("GPU bulundu: LSTM katmanları cuDNN kernel'i ile çalışacak")
+    
+    def _build_logits_model(self) -> None:
+        """
+        Son softmax'ı atlayarak logit üreten alt modeli bir kez kurar
+        
+        Sequential ve Functional modellerde son katman şu şekillerde ele alınır:
+        - softmax aktivasyonlu Dense: girdisi alınır, ağırlıklar forward pass'te uygulanır
+        - Activation("softmax") / Softmax: girdisi doğrudan logit'tir
+        - diğerleri (ör. aktivasyonsuz Dense): model çıktısı zaten logit kabul edilir
+        """
+        last = self.model.layers[-1]
+        if isinstance(last, Dense) and last.activation is activations.softmax:
+            self._logits_model = Model(self.model.inputs, last.input)
+            self._logits_dense = last
+        elif isinstance(last, Softmax) or (
+            isinstance(last, Activation) and last.activation is activations.softmax
+        ):
+            self._logits_model = Model(self.model.inputs, last.input)
+    
+    def _build_forward_logits(self) -> Callable[[tf.Tensor], tf.Tensor]:
+        """
+        Modelin softmax öncesi çıktısını (logit) hesaplayan forward pass'i kurar
+        
+        Son katman softmax aktivasyonlu bir Dense ise, yükleme sırasında kurulan
+        _logits_model son katmanın girdisini üretir ve Dense ağırlıkları
+        aktivasyonsuz uygulanır. Ayrı bir softmax katmanında bu girdi
+        doğrudan logit olarak kullanılır.
+        
+        Döndürülen fonksiyon generator'ı değil yalnızca model nesnelerini yakalar:
+        self'e bağlı bir metot veya closure saklamak döngüsel referans oluşturur
+        ve örnek son referansı bırakıldığında değil, ancak bir sonraki GC turunda
+        sonlandırılır.
+        
+        Returns:
+            (batch, seq_length) karakter index'lerinden (batch, vocab_size)
+            logit'ler hesaplayan fonksiyon
+        """
+        model = self.model
+        logits_model = self._logits_model
+        logits_dense = self._logits_dense
+        
+        def forward_logits(x: tf.Tensor) -> tf.Tensor:
+            if logits_model is None:
+                # Softmax ile bitmeyen modellerin çıktısı zaten logit'tir
+                return model(x, training=False)
+            
+            h = logits_model(x, training=False)
+            if logits_dense is None:
+                # Ayrı Activation/Softmax katmanının girdisi zaten logit'tir
+                return h
+            
+            logits = tf.matmul(h, logits_dense.kernel)
+            if logits_dense.use_bias:
+                logits = logits + logits_dense.bias
+            return logits
+        
+        return forward_logits
+    
+    def _load_tflite(self, tflite_path: Path, model_path: Path) -> bool:
+        """
+        int8 TFLite modelini, güncel ve uyumluysa yükler
+        
+        TFLite dosyası best_model.keras'tan türetilir; dönüşümde yanına yazılan
+        model_int8.json'daki kaynak özeti mevcut Keras modeliyle eşleşmiyorsa
+        (ör. yeniden eğitim sonrası), dosyanın kendi özeti tutmuyorsa veya
+        dosya okunamıyorsa ya da girdi/çıktı boyutları mevcut seq_length ve
+        vocabulary ile uyuşmuyorsa kullanılmaz.
+        
+        Args:
+            tflite_path: model_int8.tflite dosyasının yolu
+            model_path: best_model.keras dosyasının yolu
+        
+        Returns:
+            TFLite modeli yüklendiyse True, Keras modeline dönülmesi gerekiyorsa False
+        """
+        # Dosya zamanları git checkout/kopyalama ile değişebildiği için özetler karşılaştırılır
+        meta_path = tflite_path.with_suffix(".json")
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = {}
+        
+        if model_path.exists() and meta.get("source_sha256") != _file_sha256(model_path):
+            logger.warning(
+                f"{tflite_path.name} mevcut {model_path.name} dosyasından üretilmemiş; Keras modeli "
+                f"kullanılacak (yeniden dönüştürmek için: python src/convert_tflite.py)"
+            )
+            return False
+        
+        # Kesik/bozuk flatbuffer'lar interpreter'ı hata vermeden çökertebildiği için önceden elenir
+        if "sha256" in meta and meta["sha256"] != _file_sha256(tflite_path):
+            logger.warning(f"{tflite_path.name} bozuk (özet eşleşmiyor); Keras modeli kullanılacak")
+            return False
+        
+        try:
+            interpreter = tf.lite.Interpreter(
+                model_path=str(tflite_path),
+                num_threads=NUM_THREADS
+            )
+            interpreter.allocate_tensors()
+        except (ValueError, RuntimeError) as e:
+            logger.warning(f"{tflite_path.name} yüklenemedi ({e}); Keras modeli kullanılacak")
+            return False
+        input_details = interpreter.get_input_details()[0]
+        output_details = interpreter.get_output_details()[0]
+        
+        input_shape = tuple(int(d) for d in input_details["shape"])
+        output_size = int(output_details["shape"][-1])
+        if input_shape != (1, self.seq_length) or output_size != self.vocab_size:
+            logger.warning(
+                f"{tflite_path.name} boyutları uyumsuz (girdi: {input_shape}, çıktı: {output_size}; "
+                f"beklenen: {(1, self.seq_length)}, {self.vocab_size}); Keras modeli kullanılacak"
+            )
+            return False
+        
+        self._interpreter = interpreter
+        self._input_idx = input_details["index"]
+        self._output_idx = output_details["index"]
+        return True
+    
+    def _tflite_predict(self, x: np.ndarray) -> np.ndarray:
+        """
+        TFLite interpreter ile logit hesaplar
+        
+        Model sabit (1, seq_length) girdiyle dönüştürüldüğü için batch satır satır işlenir.
+        
+        Args:
+            x: (batch, seq_length) boyutunda int32 karakter index'leri
+        
+        Returns:
+            (batch, vocab_size) boyutunda logit'ler
+        """
+        with self._interpreter_lock:
+            if len(x) == 1:
+                # Tek satırda ara liste/concatenate olmadan doğrudan çıktı kopyası
+                self._interpreter.set_tensor(self._input_idx, x)
+                self._interpreter.invoke()
+                return self._interpreter.get_tensor(self._output_idx)
+            
+            # Çıktı bir kez ayrılır; satırlar interpreter'ın tensor view'undan kopyalanır
+            outputs = np.empty((len(x), self.vocab_size), dtype=np.float32)
+            for i, row in enumerate(x):
+                self._interpreter.set_tensor(self._input_idx, row[None, :])
+                self._interpreter.invoke()
+                outputs[i] = self._interpreter.tensor(self._output_idx)()[0]
+            return outputs
+    
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        """
+        Yüklenen modele göre TFLite veya Keras yolundan logit hesaplar
+        
+        Args:
+            x: (batch, seq_length) boyutunda int32 karakter index'leri
+        
+        Returns:
+            (batch, vocab_size) boyutunda logit'ler
+        """
+        if self._interpreter is not None:
+            return self._tflite_predict(x)
+        return self._graph_fn(x).numpy()
+    
+    def _encode(self, text: str) -> np.ndarray:
+        """
+        Metni lookup tablosu ile tek bir NumPy gather işlemiyle index'lere çevirir
+        
+        Args:
+            text: Dönüştürülecek metin
+        
+        Returns:
+            int32 index dizisi (her karakter için bir eleman)
+        """
+        # UTF-32 ile her karakter tek bir kod noktası olur; 255 üstü sözlük dışıdır
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        return np.where(codes < 256, self._lut[codes & 0xFF], 0).astype(np.int32)
+    
+    def sample_with_temperature(self, logits: np.ndarray, temperature: float = 1.0) -> int:
         """
         Temperature-based sampling ile sonraki karakteri seçer
         
+        softmax(logits / temperature) hesaplanır; bu, olasılıklar üzerinde
+        log(p) / temperature uygulamanın sayısal olarak kararlı karşılığıdır.
+        
         Args:
-            predictions: Model çıktısı (probability distribution)
+            logits: Model çıktısı (softmax öncesi logit'ler)
             temperature: Sampling sıcaklığı
                 - Düşük (0.2-0.5): Daha deterministik, güvenli çıktı
                 - Orta (0.5-1.0): Dengeli
@@ -120,63 +509,118 @@ class StreamlitTextGenerator:
         Returns:
             Seçilen karakterin index'i
         """
-        predictions = np.asarray(predictions).astype("float64")
-        predictions = np.log(predictions + 1e-8) / temperature
-        exp_predictions = np.exp(predictions)
-        predictions = exp_predictions / np.sum(exp_predictions)
+        if _sample_nb is not None:
+            logits = np.ascontiguousarray(logits, dtype=np.float32)
+            return int(_sample_nb(logits, temperature, np.random.random()))
         
-        return np.random.choice(len(predictions), p=predictions)
+        # float32 yeterli: max çıkarıldığı için exp taşmaz, seçilen index ayrık
+        z = np.asarray(logits, dtype=np.float32) / np.float32(temperature)
+        z -= z.max()
+        
+        # Normalize etmeden kümülatif toplam üzerinde binary search
+        cumulative = np.cumsum(np.exp(z))
+        return int(np.searchsorted(cumulative, np.random.random() * cumulative[-1], side="right"))
     
-    def generate_text(
+    def stream_generate(
         self,
         seed_text: str,
         length: int = 400,
         temperature: float = 0.5
-    ) -> str:
+    ) -> Iterator[str]:
         """
-        Verilen seed text'ten başlayarak metin üretir
+        Verilen seed text'ten başlayarak üretilen karakterleri tek tek döndürür
         
         Args:
             seed_text: Başlangıç metni
             length: Üretilecek karakter sayısı
             temperature: Sampling sıcaklığı
         
-        Returns:
-            Üretilen metin (seed text dahil)
+        Yields:
+            Üretilen her yeni karakter (seed text hariç)
         """
-        if self.model is None:
+        if self._interpreter is None and self._graph_fn is None:
             raise RuntimeError("Model yüklenmemiş!")
         
-        generated = seed_text.lower()
+        seed = seed_text.lower()
+        
+        # Kayan index penceresi: seed'in son SEQ_LENGTH karakteri bir kez encode edilir,
+        # kısa seed'ler boşluk index'i ile soldan doldurulur
+        window = np.full((1, self.seq_length), self._pad_idx, dtype=np.int32)
+        seed_idx = self._encode(seed[-self.seq_length:])
+        if len(seed_idx) > 0:
+            window[0, -len(seed_idx):] = seed_idx
         
         for _ in range(length):
-            # Son SEQ_LENGTH karakteri al
-            seq = generated[-self.seq_length:]
-            
-            # Padding (seed kısa ise)
-            if len(seq) < self.seq_length:
-                seq = " " * (self.seq_length - len(seq)) + seq
-            
-            # Karakterleri index'lere çevir
-            x = np.zeros((1, self.seq_length), dtype=np.int32)
-            for t, char in enumerate(seq):
-                x[0, t] = self.char_to_idx.get(char, 0)
-            
             # Tahmin yap
-            predictions = self.model.predict(x, verbose=0)[0]
-            next_idx = self.sample_with_temperature(predictions, temperature)
-            next_char = self.idx_to_char[next_idx]
+            logits = self.predict(window)[0]
+            next_idx = self.sample_with_temperature(logits, temperature)
+            
+            # Pencereyi bir adım kaydır ve yeni index'i sona yaz
+            window[0, :-1] = window[0, 1:]
+            window[0, -1] = next_idx
             
-            generated += next_char
+            yield self.idx_to_char[next_idx]
         
         logger.info("Metin üretimi tamamlandı")
-        return generated
+    
+    def generate_text(
+        self,
+        seed_text: str,
+        length: int = 400,
+        temperature: float = 0.5
+    ) -> str:
+        """
+        Verilen seed text'ten başlayarak metin üretir
+        
+        Args:
+            seed_text: Başlangıç metni
+            length: Üretilecek karakter sayısı
+            temperature: Sampling sıcaklığı
+        
+        Returns:
+            Üretilen metin (seed text dahil)
+        """
+        # Karakterler listede biriktirilir, sonda tek seferde birleştirilir
+        generated = [seed_text.lower()]
+        generated.extend(self.stream_generate(seed_text, length, temperature))
+        return "".join(generated)
 
 
 # =========================
 # CACHED RESOURCES
 # =========================
-@st.cache_resource
+class CachedTextGenerator(StreamlitTextGenerator):
+    """
+    st.cache_resource içinde tutulan generator
+    
+    Cache girdisi düştüğünde (TTL veya max_entries) Keras'ın global durumunu
+    temizler. clear_session global olduğu için bu davranış yalnızca
+    cache'lenen örneğe verilir.
+    """
+    
+    def __del__(self):
+        try:
+            # Model ve interpreter referansları bırakılmadan clear_session belleği geri veremez
+            self._graph_fn = None
+            self.model = None
+            self._logits_model = None
+            self._logits_dense = None
+            self._interpreter = None
+            tf.keras.backend.clear_session()
+            gc.collect()
+        except Exception:
+            # Interpreter kapanırken modüller çoktan kaldırılmış olabilir
+            pass
+
+
+# cache_data değil cache_resource: Keras Model / TFLite interpreter pickle edilemez
+# ve tüm oturumlar aynı örneği paylaşmalıdır. max_entries=1 ve TTL, uzun süre çalışan
+# deployment'larda yeniden yüklemelerin bellekte birikmesini engeller.
+@st.cache_resource(
+    max_entries=1,
+    ttl=Config.CACHE_TTL,
+    show_spinner="Model yükleniyor..."
+)
 def load_generator() -> StreamlitTextGenerator:
     """
     Text generator'ı yükler ve cache'ler
@@ -184,16 +628,48 @@ def load_generator() -> StreamlitTextGenerator:
     Returns:
         Yüklenmiş StreamlitTextGenerator instance
     """
-    generator = StreamlitTextGenerator(
+    generator = CachedTextGenerator(
         artifacts_dir=Config.ARTIFACTS_DIR,
         seq_length=Config.SEQ_LENGTH
     )
     generator.load_model_and_vocab()
+    
+    # Cache'lenen generator kalıcı olduğu için ısıtma maliyeti bir kez ödenir;
+    # ısıtma hatası uygulamanın açılmasını engellememeli
+    try:
+        generator.warmup()
+    except Exception as e:
+        logger.warning(f"Model ısıtma başarısız: {e}")
+    
     return generator
 
 # =========================
 # STREAMLIT UI
 # =========================
+def render_output(output: str) -> None:
+    """
+    Üretilen metni ve istatistiklerini gösterir
+    
+    Args:
+        output: Gösterilecek metin (seed text dahil)
+    """
+    st.text_area(
+        label="",
+        value=output,
+        height=400,
+        label_visibility="collapsed"
+    )
+    
+    # İstatistikler
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Toplam Karakter", len(output))
+    with col2:
+        st.metric("Kelime Sayısı", len(output.split()))
+    with col3:
+        st.metric("Satır Sayısı", output.count('\n') + 1)
+
+
 def main():
     """Ana Streamlit uygulaması"""
     
@@ -280,6 +756,16 @@ def main():
         type="primary",
         use_container_width=True
     )
+    # Durdur: butona basılması script'i yeniden çalıştırır ve süren üretimi keser
+    stop_btn = st.sidebar.button(
+        "⏹️ Durdur",
+        use_container_width=True
+    )
+    
+    # Durdur dışındaki her çalıştırma (ör. üretim sırasında slider değişimi) önceki
+    # yarım metni düşürür; böylece sonraki bir Durdur eski metni göstermez
+    if not stop_btn:
+        st.session_state["partial_output"] = None
     
     # Metin üretimi
     if generate_btn:
@@ -288,38 +774,44 @@ def main():
             return
         
         try:
-            with st.spinner("🔄 Metin üretiliyor... Lütfen bekleyin."):
-                output = generator.generate_text(
+            st.subheader("📜 Üretilen Metin")
+            placeholder = st.empty()
+            
+            # Karakterler geldikçe gösterilir; yarım metin durdurma sonrası için saklanır
+            chars = [seed_text.lower()]
+            st.session_state["partial_output"] = chars[0]
+            for i, char in enumerate(
+                generator.stream_generate(
                     seed_text=seed_text,
                     length=length,
                     temperature=temperature
-                )
+                ),
+                start=1
+            ):
+                chars.append(char)
+                if i % Config.STREAM_EVERY == 0:
+                    partial = "".join(chars)
+                    st.session_state["partial_output"] = partial
+                    placeholder.text(partial)
+            
+            output = "".join(chars)
+            st.session_state["partial_output"] = None
             
             # Sonuçları göster
+            with placeholder.container():
+                render_output(output)
             st.success("✅ Metin başarıyla üretildi!")
             
-            # Metin alanı
-            st.subheader("📜 Üretilen Metin")
-            st.text_area(
-                label="",
-                value=output,
-                height=400,
-                label_visibility="collapsed"
-            )
-            
-            # İstatistikler
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Toplam Karakter", len(output))
-            with col2:
-                st.metric("Kelime Sayısı", len(output.split()))
-            with col3:
-                st.metric("Satır Sayısı", output.count('\n') + 1)
-            
         except Exception as e:
             st.error(f"❌ Metin üretilirken hata oluştu: {e}")
             logger.error(f"Üretim hatası: {e}")
     
+    elif stop_btn and st.session_state.get("partial_output"):
+        st.warning("⏹️ Üretim durduruldu")
+        st.subheader("📜 Üretilen Metin")
+        render_output(st.session_state["partial_output"])
+        st.session_state["partial_output"] = None
+    
     # Alt bilgi
     st.markdown("---")
     st.caption("💡 **Character-level LSTM** | Generative AI Demo | Tolstoy Corpus")
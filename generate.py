@@ -12,17 +12,32 @@ Temel işlevler:
 
 import os
 import json
+import hashlib
 import argparse
 import logging
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Callable, Dict, Tuple
 
 # TensorFlow uyarılarını kapat
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'  # 0=all, 1=info, 2=warning, 3=error
 os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'  # oneDNN uyarılarını kapat
 
 import numpy as np
-from tensorflow.keras.models import load_model, Model
+import tensorflow as tf
+from tensorflow.keras import activations
+from tensorflow.keras.layers import LSTM, Activation, Bidirectional, Dense, Softmax
+from tensorflow.keras.models import clone_model, load_model, Model
+
+# batch=1 çıkarımda varsayılan thread havuzu her op'a senkronizasyon maliyeti ekler;
+# thread sayısı TG_THREADS ortam değişkeni ile değiştirilebilir
+NUM_THREADS = int(os.environ.get("TG_THREADS", "1"))
+tf.config.threading.set_intra_op_parallelism_threads(NUM_THREADS)
+tf.config.threading.set_inter_op_parallelism_threads(NUM_THREADS)
+
+try:
+    import numba
+except ImportError:  # Numba opsiyonel bir hızlandırma bağımlılığıdır
+    numba = None
 
 # Logging yapılandırması
 logging.basicConfig(
@@ -32,54 +47,145 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _sample_kernel(logits: np.ndarray, temperature: float, u: float) -> int:
+    """
+    Temperature ölçekleme, softmax ve örneklemeyi tek geçişte yapan kernel
+    
+    Args:
+        logits: Model çıktısı (softmax öncesi logit'ler)
+        temperature: Sampling sıcaklığı
+        u: [0, 1) aralığında uniform rastgele sayı
+    
+    Returns:
+        Seçilen karakterin index'i
+    """
+    n = logits.shape[0]
+    z = np.empty(n, dtype=np.float32)
+    
+    # log-sum-exp: taşmayı önlemek için maksimum değer çıkarılır
+    m = logits[0] / temperature
+    for i in range(n):
+        z[i] = logits[i] / temperature
+        if z[i] > m:
+            m = z[i]
+    
+    total = np.float32(0.0)
+    for i in range(n):
+        z[i] = np.exp(z[i] - m)
+        total += z[i]
+    
+    # Kümülatif toplamda u * total eşiğini geçen ilk index
+    threshold = u * total
+    acc = np.float32(0.0)
+    for i in range(n):
+        acc += z[i]
+        if acc > threshold:
+            return i
+    return n - 1
+
+
+def _file_sha256(path: Path) -> str:
+    """
+    Dosyanın SHA-256 özetini parça parça okuyarak hesaplar
+    
+    Args:
+        path: Özeti alınacak dosyanın yolu
+    
+    Returns:
+        Hex formatında SHA-256 özeti
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Numba varsa kernel float32 logit imzasıyla import sırasında JIT derlenir (SIMD
+# vektörizasyonu için), yoksa NumPy yolu kullanılır. u skaler olduğu için float64
+# kalır; float32'ye yuvarlandığında 1.0 olup her zaman son index'i seçtirebilir.
+_sample_nb = (
+    numba.njit("int64(float32[::1], float32, float64)", cache=True, fastmath=True)(_sample_kernel)
+    if numba is not None else None
+)
+
+
 class TextGenerator:
     """LSTM modeli ile metin üretme sınıfı"""
     
-    def __init__(self, artifacts_dir: str = "artifacts", seq_length: int = 40):
+    def __init__(
+        self,
+        artifacts_dir: str = "artifacts",
+        seq_length: int = 40,
+        use_tflite: bool = True
+    ):
         """
         Args:
             artifacts_dir: Model ve vocabulary dosyalarının bulunduğu dizin
             seq_length: Girdi sequence uzunluğu (model eğitimindekiyle aynı olmalı)
+            use_tflite: model_int8.tflite varsa Keras modeli yerine onu kullan
         """
         self.script_dir = Path(__file__).parent
         self.artifacts_dir = (self.script_dir / artifacts_dir).resolve()
         self.seq_length = seq_length
+        self.use_tflite = use_tflite
         
         self.model: Model = None
+        self._graph_fn: Callable[[tf.Tensor], tf.Tensor] = None
+        self._logits_model: Model = None
+        self._logits_dense: Dense = None
+        self._interpreter: tf.lite.Interpreter = None
+        self._input_idx: int = 0
+        self._output_idx: int = 0
         self.char_to_idx: Dict[str, int] = {}
-        self.idx_to_char: Dict[str, str] = {}
+        self.idx_to_char: Tuple[str, ...] = ()
         self.vocab_size: int = 0
+        self._lut: np.ndarray = None
+        self._pad_idx: int = 0
         
         logger.info(f"Artifacts directory: {self.artifacts_dir}")
         
     def load_model_and_vocab(self, verbose: bool = True) -> None:
         """Model ve vocabulary dosyalarını yükler"""
         try:
-            # Model yükleme
-            model_path = self.artifacts_dir / "best_model.keras"
-            if not model_path.exists():
-                raise FileNotFoundError(f"Model dosyası bulunamadı: {model_path}")
-            
-            if verbose:
-                print("🔄 Model yükleniyor...")
-            self.model = load_model(model_path)
-            if verbose:
-                print("✅ Model başarıyla yüklendi")
-            
-            # Vocabulary yükleme
-            char_to_idx_path = self.artifacts_dir / "char_to_idx.json"
-            idx_to_char_path = self.artifacts_dir / "idx_to_char.json"
+            # Vocabulary yükleme: vocab.npz (hazır LUT) varsa JSON parse edilmez
+            vocab_path = self.artifacts_dir / "vocab.npz"
+            if vocab_path.exists():
+                self._load_vocab_npz(vocab_path)
+            else:
+                self._load_vocab_json()
             
-            if not char_to_idx_path.exists() or not idx_to_char_path.exists():
-                raise FileNotFoundError("Vocabulary dosyaları bulunamadı")
+            self.vocab_size = len(self.idx_to_char)
+            self._pad_idx = int(self._lut[ord(" ")])
             
-            with open(char_to_idx_path, "r", encoding="utf-8") as f:
-                self.char_to_idx = json.load(f)
+            # Model yükleme: int8 TFLite modeli güncel ve uyumluysa CPU çıkarımı için tercih edilir
+            # (boyut kontrolü için vocabulary önce yüklenir)
+            tflite_path = self.artifacts_dir / "model_int8.tflite"
+            model_path = self.artifacts_dir / "best_model.keras"
             
-            with open(idx_to_char_path, "r", encoding="utf-8") as f:
-                self.idx_to_char = json.load(f)
+            if self.use_tflite and tflite_path.exists() and self._load_tflite(tflite_path, model_path):
+                if verbose:
+                    print("✅ TFLite modeli başarıyla yüklendi")
+            else:
+                if not model_path.exists():
+                    raise FileNotFoundError(f"Model dosyası bulunamadı: {model_path}")
+                
+                if verbose:
+                    print("🔄 Model yükleniyor...")
+                self.model = load_model(model_path)
+                self._ensure_cudnn_compatible()
+                if verbose:
+                    print("✅ Model başarıyla yüklendi")
+                
+                self._build_logits_model()
+                
+                # Sabit input shape ile bir kez trace edilen, logit döndüren forward pass
+                # (batch boyutu serbest: generate_multiple tüm temperature'ları birlikte işler)
+                self._graph_fn = tf.function(
+                    self._build_forward_logits(),
+                    input_signature=[tf.TensorSpec((None, self.seq_length), tf.int32)]
+                )
             
-            self.vocab_size = len(self.char_to_idx)
             if verbose:
                 print(f"✅ Vocabulary yüklendi (boyut: {self.vocab_size})")
             
@@ -87,12 +193,284 @@ class TextGenerator:
             logger.error(f"Model veya vocabulary yüklenirken hata oluştu: {e}")
             raise
     
-    def sample_with_temperature(self, predictions: np.ndarray, temperature: float = 1.0) -> int:
+    def _load_vocab_npz(self, vocab_path: Path) -> None:
+        """
+        Vocabulary'yi tek bir .npz dosyasından yükler
+        
+        Dosya, doğrudan kullanılabilen 256 girişli byte -> index LUT'unu
+        ve index -> karakter byte dizisini içerir.
+        
+        Args:
+            vocab_path: vocab.npz dosyasının yolu
+        """
+        with np.load(vocab_path) as vocab:
+            self._lut = vocab["lut"].astype(np.int32)
+            idx2char = vocab["idx2char"].tobytes().decode("latin-1")
+        
+        self.idx_to_char = tuple(idx2char)
+        self.char_to_idx = {ch: i for i, ch in enumerate(self.idx_to_char)}
+    
+    def _load_vocab_json(self) -> None:
+        """Vocabulary'yi char_to_idx.json ve idx_to_char.json dosyalarından yükler"""
+        char_to_idx_path = self.artifacts_dir / "char_to_idx.json"
+        idx_to_char_path = self.artifacts_dir / "idx_to_char.json"
+        
+        if not char_to_idx_path.exists() or not idx_to_char_path.exists():
+            raise FileNotFoundError("Vocabulary dosyaları bulunamadı")
+        
+        with open(char_to_idx_path, "r", encoding="utf-8") as f:
+            self.char_to_idx = json.load(f)
+        
+        with open(idx_to_char_path, "r", encoding="utf-8") as f:
+            idx_to_char_raw = json.load(f)
+        
+        # Index -> karakter için dict yerine tuple: hash'siz O(1) erişim
+        self.idx_to_char = tuple(idx_to_char_raw[str(i)] for i in range(len(idx_to_char_raw)))
+        
+        # Karakter -> index lookup tablosu (sözlükte olmayanlar 0)
+        self._lut = np.zeros(256, dtype=np.int32)
+        for ch, i in self.char_to_idx.items():
+            if ord(ch) < 256:
+                self._lut[ord(ch)] = i
+    
+    def _ensure_cudnn_compatible(self) -> None:
+        """
+        LSTM katmanlarının GPU'da cuDNN fused kernel'ini kullanabilmesini sağlar
+        
+        unroll=True veya recurrent_dropout > 0 olan LSTM'ler yavaş, adım adım
+        implementasyona düşer. Bu iki ayar çıkarım sonucunu değiştirmeden
+        kapatılabildiği için model aynı mimariyle yeniden kurulup ağırlıklar
+        aktarılır. Aktivasyon veya bias farkları çıktıyı değiştireceğinden
+        yalnızca uyarı olarak raporlanır.
+        """
+        lstm_layers = []
+        for layer in self.model.layers:
+            if isinstance(layer, Bidirectional):
+                lstm_layers.extend([layer.forward_layer, layer.backward_layer])
+            elif isinstance(layer, LSTM):
+                lstm_layers.append(layer)
+        
+        needs_rebuild = False
+        cudnn_compatible = True
+        for lstm in lstm_layers:
+            if lstm.unroll or lstm.recurrent_dropout > 0:
+                needs_rebuild = True
+            if (
+                lstm.activation is not activations.tanh
+                or lstm.recurrent_activation is not activations.sigmoid
+                or not lstm.use_bias
+            ):
+                cudnn_compatible = False
+                logger.warning(f"{lstm.name}: aktivasyon/bias ayarları cuDNN kernel'i ile uyumsuz")
+        
+        if needs_rebuild:
+            def clone_layer(layer):
+                config = layer.get_config()
+                if isinstance(layer, Bidirectional):
+                    lstm_configs = [config["layer"]["config"]]
+                    if config.get("backward_layer"):
+                        lstm_configs.append(config["backward_layer"]["config"])
+                elif isinstance(layer, LSTM):
+                    lstm_configs = [config]
+                else:
+                    lstm_configs = []
+                for lstm_config in lstm_configs:
+                    lstm_config["unroll"] = False
+                    lstm_config["recurrent_dropout"] = 0.0
+                return layer.__class__.from_config(config)
+            
+            rebuilt = clone_model(self.model, clone_function=clone_layer)
+            rebuilt.set_weights(self.model.get_weights())
+            self.model = rebuilt
+            logger.info("LSTM katmanları cuDNN uyumlu ayarlarla yeniden kuruldu")
+        
+        # Uyumsuz katman varsa GPU'da da genel (yavaş) implementasyon kullanılır
+        if cudnn_compatible and tf.config.list_physical_devices("GPU"):
+            logger.info("GPU bulundu: LSTM katmanları cuDNN kernel'i ile çalışacak")
+    
+    def _build_logits_model(self) -> None:
+        """
+        Son softmax'ı atlayarak logit üreten alt modeli bir kez kurar
+        
+        Sequential ve Functional modellerde son katman şu şekillerde ele alınır:
+        - softmax aktivasyonlu Dense: girdisi alınır, ağırlıklar forward pass'te uygulanır
+        - Activation("softmax") / Softmax: girdisi doğrudan logit'tir
+        - diğerleri (ör. aktivasyonsuz Dense): model çıktısı zaten logit kabul edilir
+        """
+        last = self.model.layers[-1]
+        if isinstance(last, Dense) and last.activation is activations.softmax:
+            self._logits_model = Model(self.model.inputs, last.input)
+            self._logits_dense = last
+        elif isinstance(last, Softmax) or (
+            isinstance(last, Activation) and last.activation is activations.softmax
+        ):
+            self._logits_model = Model(self.model.inputs, last.input)
+    
+    def _build_forward_logits(self) -> Callable[[tf.Tensor], tf.Tensor]:
+        """
+        Modelin softmax öncesi çıktısını (logit) hesaplayan forward pass'i kurar
+        
+        Son katman softmax aktivasyonlu bir Dense ise, yükleme sırasında kurulan
+        _logits_model son katmanın girdisini üretir ve Dense ağırlıkları
+        aktivasyonsuz uygulanır. Ayrı bir softmax katmanında bu girdi
+        doğrudan logit olarak kullanılır.
+        
+        Döndürülen fonksiyon generator'ı değil yalnızca model nesnelerini yakalar:
+        self'e bağlı bir metot veya closure saklamak döngüsel referans oluşturur
+        ve örnek son referansı bırakıldığında değil, ancak bir sonraki GC turunda
+        sonlandırılır.
+        
+        Returns:
+            (batch, seq_length) karakter index'lerinden (batch, vocab_size)
+            logit'ler hesaplayan fonksiyon
+        """
+        model = self.model
+        logits_model = self._logits_model
+        logits_dense = self._logits_dense
+        
+        def forward_logits(x: tf.Tensor) -> tf.Tensor:
+            if logits_model is None:
+                # Softmax ile bitmeyen modellerin çıktısı zaten logit'tir
+                return model(x, training=False)
+            
+            h = logits_model(x, training=False)
+            if logits_dense is None:
+                # Ayrı Activation/Softmax katmanının girdisi zaten logit'tir
+                return h
+            
+            logits = tf.matmul(h, logits_dense.kernel)
+            if logits_dense.use_bias:
+                logits = logits + logits_dense.bias
+            return logits
+        
+        return forward_logits
+    
+    def _load_tflite(self, tflite_path: Path, model_path: Path) -> bool:
+        """
+        int8 TFLite modelini, güncel ve uyumluysa yükler
+        
+        TFLite dosyası best_model.keras'tan türetilir; dönüşümde yanına yazılan
+        model_int8.json'daki kaynak özeti mevcut Keras modeliyle eşleşmiyorsa
+        (ör. yeniden eğitim sonrası), dosyanın kendi özeti tutmuyorsa veya
+        dosya okunamıyorsa ya da girdi/çıktı boyutları mevcut seq_length ve
+        vocabulary ile uyuşmuyorsa kullanılmaz.
+        
+        Args:
+            tflite_path: model_int8.tflite dosyasının yolu
+            model_path: best_model.keras dosyasının yolu
+        
+        Returns:
+            TFLite modeli yüklendiyse True, Keras modeline dönülmesi gerekiyorsa False
+        """
+        # Dosya zamanları git checkout/kopyalama ile değişebildiği için özetler karşılaştırılır
+        meta_path = tflite_path.with_suffix(".json")
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = {}
+        
+        if model_path.exists() and meta.get("source_sha256") != _file_sha256(model_path):
+            logger.warning(
+                f"{tflite_path.name} mevcut {model_path.name} dosyasından üretilmemiş; Keras modeli "
+                f"kullanılacak (yeniden dönüştürmek için: python src/convert_tflite.py)"
+            )
+            return False
+        
+        # Kesik/bozuk flatbuffer'lar interpreter'ı hata vermeden çökertebildiği için önceden elenir
+        if "sha256" in meta and meta["sha256"] != _file_sha256(tflite_path):
+            logger.warning(f"{tflite_path.name} bozuk (özet eşleşmiyor); Keras modeli kullanılacak")
+            return False
+        
+        try:
+            interpreter = tf.lite.Interpreter(
+                model_path=str(tflite_path),
+                num_threads=NUM_THREADS
+            )
+            interpreter.allocate_tensors()
+        except (ValueError, RuntimeError) as e:
+            logger.warning(f"{tflite_path.name} yüklenemedi ({e}); Keras modeli kullanılacak")
+            return False
+        input_details = interpreter.get_input_details()[0]
+        output_details = interpreter.get_output_details()[0]
+        
+        input_shape = tuple(int(d) for d in input_details["shape"])
+        output_size = int(output_details["shape"][-1])
+        if input_shape != (1, self.seq_length) or output_size != self.vocab_size:
+            logger.warning(
+                f"{tflite_path.name} boyutları uyumsuz (girdi: {input_shape}, çıktı: {output_size}; "
+                f"beklenen: {(1, self.seq_length)}, {self.vocab_size}); Keras modeli kullanılacak"
+            )
+            return False
+        
+        self._interpreter = interpreter
+        self._input_idx = input_details["index"]
+        self._output_idx = output_details["index"]
+        return True
+    
+    def _tflite_predict(self, x: np.ndarray) -> np.ndarray:
+        """
+        TFLite interpreter ile logit hesaplar
+        
+        Model sabit (1, seq_length) girdiyle dönüştürüldüğü için batch satır satır işlenir.
+        
+        Args:
+            x: (batch, seq_length) boyutunda int32 karakter index'leri
+        
+        Returns:
+            (batch, vocab_size) boyutunda logit'ler
+        """
+        if len(x) == 1:
+            # Tek satırda ara liste/concatenate olmadan doğrudan çıktı kopyası
+            self._interpreter.set_tensor(self._input_idx, x)
+            self._interpreter.invoke()
+            return self._interpreter.get_tensor(self._output_idx)
+        
+        # Çıktı bir kez ayrılır; satırlar interpreter'ın tensor view'undan kopyalanır
+        outputs = np.empty((len(x), self.vocab_size), dtype=np.float32)
+        for i, row in enumerate(x):
+            self._interpreter.set_tensor(self._input_idx, row[None, :])
+            self._interpreter.invoke()
+            outputs[i] = self._interpreter.tensor(self._output_idx)()[0]
+        return outputs
+    
+    def predict(self, x: np.ndarray) -> np.ndarray:
+        """
+        Yüklenen modele göre TFLite veya Keras yolundan logit hesaplar
+        
+        Args:
+            x: (batch, seq_length) boyutunda int32 karakter index'leri
+        
+        Returns:
+            (batch, vocab_size) boyutunda logit'ler
+        """
+        if self._interpreter is not None:
+            return self._tflite_predict(x)
+        return self._graph_fn(x).numpy()
+    
+    def _encode(self, text: str) -> np.ndarray:
+        """
+        Metni lookup tablosu ile tek bir NumPy gather işlemiyle index'lere çevirir
+        
+        Args:
+            text: Dönüştürülecek metin
+        
+        Returns:
+            int32 index dizisi (her karakter için bir eleman)
+        """
+        # UTF-32 ile her karakter tek bir kod noktası olur; 255 üstü sözlük dışıdır
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        return np.where(codes < 256, self._lut[codes & 0xFF], 0).astype(np.int32)
+    
+    def sample_with_temperature(self, logits: np.ndarray, temperature: float = 1.0) -> int:
         """
         Temperature-based sampling ile sonraki karakteri seçer
         
+        softmax(logits / temperature) hesaplanır; bu, olasılıklar üzerinde
+        log(p) / temperature uygulamanın sayısal olarak kararlı karşılığıdır.
+        
         Args:
-            predictions: Model çıktısı (probability distribution)
+            logits: Model çıktısı (softmax öncesi logit'ler)
             temperature: Sampling sıcaklığı
                 - Düşük (0.2-0.5): Daha deterministik, güvenli çıktı
                 - Orta (0.5-1.0): Dengeli
@@ -101,12 +479,41 @@ class TextGenerator:
         Returns:
             Seçilen karakterin index'i
         """
-        predictions = np.asarray(predictions).astype("float64")
-        predictions = np.log(predictions + 1e-8) / temperature
-        exp_predictions = np.exp(predictions)
-        predictions = exp_predictions / np.sum(exp_predictions)
+        if _sample_nb is not None:
+            logits = np.ascontiguousarray(logits, dtype=np.float32)
+            return int(_sample_nb(logits, temperature, np.random.random()))
+        
+        # float32 yeterli: max çıkarıldığı için exp taşmaz, seçilen index ayrık
+        z = np.asarray(logits, dtype=np.float32) / np.float32(temperature)
+        z -= z.max()
+        
+        # Normalize etmeden kümülatif toplam üzerinde binary search
+        cumulative = np.cumsum(np.exp(z))
+        return int(np.searchsorted(cumulative, np.random.random() * cumulative[-1], side="right"))
+    
+    def sample_batch_with_temperature(
+        self,
+        logits: np.ndarray,
+        temperatures: np.ndarray
+    ) -> np.ndarray:
+        """
+        Her satırı kendi temperature değeriyle örnekleyen vektörize sampling
+        
+        Args:
+            logits: (k, vocab_size) boyutunda model çıktısı (softmax öncesi)
+            temperatures: (k,) boyutunda satır başına sampling sıcaklığı
         
-        return np.random.choice(len(predictions), p=predictions)
+        Returns:
+            (k,) boyutunda seçilen karakter index'leri
+        """
+        z = np.asarray(logits, dtype=np.float32) / temperatures[:, None]
+        z -= z.max(axis=1, keepdims=True)
+        cumulative = np.cumsum(np.exp(z), axis=1)
+        
+        # Her satırda u * toplam eşiğini geçen ilk index
+        thresholds = np.random.random(len(z)) * cumulative[:, -1]
+        next_idx = (cumulative <= thresholds[:, None]).sum(axis=1)
+        return np.minimum(next_idx, z.shape[1] - 1)
     
     def generate_text(
         self,
@@ -127,39 +534,41 @@ class TextGenerator:
         Returns:
             Üretilen metin (seed text dahil)
         """
-        if self.model is None:
+        if self._interpreter is None and self._graph_fn is None:
             raise RuntimeError("Model yüklenmemiş. Önce load_model_and_vocab() çağırın.")
         
-        generated = seed_text.lower()
+        seed = seed_text.lower()
+        
+        # Karakterler listede biriktirilir, sonda tek seferde birleştirilir
+        generated = list(seed)
+        
+        # Kayan index penceresi: seed'in son SEQ_LENGTH karakteri bir kez encode edilir,
+        # kısa seed'ler boşluk index'i ile soldan doldurulur
+        window = np.full((1, self.seq_length), self._pad_idx, dtype=np.int32)
+        seed_idx = self._encode(seed[-self.seq_length:])
+        if len(seed_idx) > 0:
+            window[0, -len(seed_idx):] = seed_idx
         
         if verbose:
             print(f"⏳ Metin üretiliyor (temperature: {temperature})...")
         
         for i in range(length):
-            # Son SEQ_LENGTH karakteri al
-            seq = generated[-self.seq_length:]
-            
-            # Padding (seed kısa ise)
-            if len(seq) < self.seq_length:
-                seq = " " * (self.seq_length - len(seq)) + seq
-            
-            # Karakterleri index'lere çevir
-            x = np.zeros((1, self.seq_length), dtype=np.int32)
-            for t, char in enumerate(seq):
-                x[0, t] = self.char_to_idx.get(char, 0)
-            
             # Tahmin yap
-            predictions = self.model.predict(x, verbose=0)[0]
-            next_idx = self.sample_with_temperature(predictions, temperature)
-            next_char = self.idx_to_char[str(next_idx)]
+            logits = self.predict(window)[0]
+            next_idx = self.sample_with_temperature(logits, temperature)
+            next_char = self.idx_to_char[next_idx]
             
-            generated += next_char
+            generated.append(next_char)
+            
+            # Pencereyi bir adım kaydır ve yeni index'i sona yaz
+            window[0, :-1] = window[0, 1:]
+            window[0, -1] = next_idx
             
             if verbose:
                 logger.debug(f"{i + 1}/{length} karakter üretildi")
         
         logger.info("Metin üretimi tamamlandı")
-        return generated
+        return "".join(generated)
     
     def generate_multiple(
         self,
@@ -171,6 +580,11 @@ class TextGenerator:
         """
         Farklı temperature değerleriyle birden fazla metin üretir
         
+        Tüm temperature'lar tek bir (k, seq_length) batch olarak ilerletilir.
+        Keras modelinde her adımda k ayrı çağrı yerine tek bir forward pass
+        yapılır; TFLite modeli sabit batch=1 ile dönüştürüldüğü için satırlar
+        her adımda sırayla çalıştırılır.
+        
         Args:
             seed_text: Başlangıç metni
             length: Üretilecek karakter sayısı
@@ -180,18 +594,54 @@ class TextGenerator:
         Returns:
             Temperature -> üretilen metin dictionary'si
         """
+        if any(t <= 0 for t in temperatures):
+            raise ValueError(f"Temperature değerleri pozitif olmalı: {temperatures}")
+        
         results = {}
         
         print(f"\n📝 Seed Text: '{seed_text}'")
         print(f"📊 Karakter sayısı: {length}")
         print(f"🌡️  Temperature değerleri: {temperatures}\n")
         
-        for i, temp in enumerate(temperatures, 1):
+        if self._interpreter is None and self._graph_fn is None:
+            raise RuntimeError("Model yüklenmemiş. Önce load_model_and_vocab() çağırın.")
+        
+        k = len(temperatures)
+        temps = np.asarray(temperatures, dtype=np.float32)
+        seed = seed_text.lower()
+        
+        # Her temperature için bir satır; tüm satırlar aynı seed ile başlar
+        window = np.full((k, self.seq_length), self._pad_idx, dtype=np.int32)
+        seed_idx = self._encode(seed[-self.seq_length:])
+        if len(seed_idx) > 0:
+            window[:, -len(seed_idx):] = seed_idx
+        generated = [list(seed) for _ in range(k)]
+        
+        if verbose:
+            print(f"⏳ Metin üretiliyor (batch: {k} temperature)...")
+        
+        for step in range(length):
+            logits = self.predict(window)
+            next_idx = self.sample_batch_with_temperature(logits, temps)
+            
+            for row, idx in enumerate(next_idx):
+                generated[row].append(self.idx_to_char[idx])
+            
+            # Tüm pencereleri bir adım kaydır ve yeni index'leri sona yaz
+            window[:, :-1] = window[:, 1:]
+            window[:, -1] = next_idx
+            
+            if verbose:
+                logger.debug(f"{step + 1}/{length} karakter üretildi")
+        
+        logger.info("Metin üretimi tamamlandı")
+        
+        for i, (temp, chars) in enumerate(zip(temperatures, generated), 1):
             print(f"\n{'=' * 70}")
             print(f"  [{i}/{len(temperatures)}] Temperature: {temp}")
             print('=' * 70)
             
-            generated_text = self.generate_text(seed_text, length, temp, verbose)
+            generated_text = "".join(chars)
             results[temp] = generated_text
             print(generated_text)
             print()
@@ -220,7 +670,10 @@ def main():
         type=float,
         nargs="+",
         default=[0.2, 0.5, 1.0],
-        help="Temperature değerleri (örn: --temperature 0.5 veya --temperature 0.2 0.5 1.0)"
+        help=(
+            "Pozitif temperature değerleri (örn: --temperature 0.5 veya --temperature 0.2 0.5 1.0); "
+            "Keras modelinde tek batch'te, TFLite modelinde satır satır işlenir"
+        )
     )
     parser.add_argument(
         "--artifacts-dir",
@@ -234,6 +687,11 @@ def main():
         default=40,
         help="Girdi sequence uzunluğu (model eğitimindekiyle aynı olmalı)"
     )
+    parser.add_argument(
+        "--no-tflite",
+        action="store_true",
+        help="model_int8.tflite olsa bile Keras modelini kullan"
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -250,7 +708,8 @@ def main():
         # Generator oluştur ve model yükle
         generator = TextGenerator(
             artifacts_dir=args.artifacts_dir,
-            seq_length=args.seq_length
+            seq_length=args.seq_length,
+            use_tflite=not args.no_tflite
         )
         generator.load_model_and_vocab(verbose=True)
         
@@ -0,0 +1,167 @@
+"""
+TFLite Conversion Module for Character-Level LSTM Model
+========================================================
+Bu modül, eğitilmiş Keras modelini CPU çıkarımı için int8 dynamic-range
+quantization uygulanmış bir TensorFlow Lite modeline dönüştürür.
+
+Temel işlevler:
+- Keras modelini yükleme
+- Son softmax katmanını kaldırarak logit döndüren model oluşturma
+- Sabit (1, seq_length) girdi boyutuyla TFLite dönüşümü
+- Dönüştürülmüş modeli artifacts dizinine kaydetme
+- Kaynak Keras modelinin özetini model_int8.json'a yazma
+"""
+
+import os
+import json
+import hashlib
+import argparse
+import logging
+from pathlib import Path
+
+# TensorFlow uyarılarını kapat
+os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
+os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
+
+import tensorflow as tf
+from tensorflow.keras import activations
+
+# Logging yapılandırması
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def _file_sha256(path: Path) -> str:
+    """
+    Dosyanın SHA-256 özetini parça parça okuyarak hesaplar
+    
+    Args:
+        path: Özeti alınacak dosyanın yolu
+    
+    Returns:
+        Hex formatında SHA-256 özeti
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TFLiteExporter:
+    """Keras modelini int8 TFLite modeline dönüştürme sınıfı"""
+
+    def __init__(self, artifacts_dir: str, seq_length: int = 40):
+        """
+        Args:
+            artifacts_dir: Model dosyalarının bulunduğu ve çıktının yazılacağı dizin
+            seq_length: Girdi sequence uzunluğu (model eğitimindekiyle aynı olmalı)
+        """
+        # Script'in bulunduğu dizine göre mutlak path oluştur
+        self.script_dir = Path(__file__).parent
+        self.artifacts_dir = (self.script_dir / artifacts_dir).resolve()
+        self.seq_length = seq_length
+
+        logger.info(f"Artifacts directory: {self.artifacts_dir}")
+
+    def build_logits_model(self) -> tf.keras.Model:
+        """
+        Keras modelini yükler ve logit döndüren sabit batch'li bir model oluşturur
+
+        Uygulama sampling'i softmax öncesi logit'ler üzerinde yaptığı için son
+        Dense katmanının softmax aktivasyonu kaldırılır. Bidirectional LSTM
+        katmanlarının TFLite'a dönüşebilmesi için batch boyutu 1'e sabitlenir.
+
+        Returns:
+            (1, seq_length) int32 girdi alan, logit döndüren model
+        """
+        model_path = self.artifacts_dir / "best_model.keras"
+        if not model_path.exists():
+            raise FileNotFoundError(f"Model dosyası bulunamadı: {model_path}")
+
+        logger.info("Model yükleniyor...")
+        model = tf.keras.models.load_model(model_path)
+
+        last = model.layers[-1]
+        if getattr(last, "activation", None) is activations.softmax:
+            last.activation = activations.linear
+            logger.info("Son katmanın softmax aktivasyonu kaldırıldı (logit çıktı)")
+
+        inputs = tf.keras.Input(batch_shape=(1, self.seq_length), dtype="int32")
+        return tf.keras.Model(inputs, model(inputs, training=False))
+
+    def convert(self) -> Path:
+        """
+        Modeli dynamic-range int8 quantization ile TFLite'a dönüştürür ve kaydeder
+        
+        Uygulamalar TFLite modelini yalnızca güncel Keras modelinden üretildiyse
+        ve bozulmamışsa kullandığı için best_model.keras'ın ve .tflite dosyasının
+        SHA-256 özetleri model_int8.json'a yazılır.
+
+        Returns:
+            Kaydedilen .tflite dosyasının yolu
+        """
+        model = self.build_logits_model()
+
+        logger.info("TFLite dönüşümü başlatılıyor (int8 dynamic range)...")
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        tflite_model = converter.convert()
+
+        output_path = self.artifacts_dir / "model_int8.tflite"
+        with open(output_path, "wb") as f:
+            f.write(tflite_model)
+        logger.info(f"Kaydedildi: {output_path} ({len(tflite_model) / 1024:.0f} KB)")
+        
+        meta_path = output_path.with_suffix(".json")
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "source": "best_model.keras",
+                    "source_sha256": _file_sha256(self.artifacts_dir / "best_model.keras"),
+                    "sha256": _file_sha256(output_path),
+                    "seq_length": self.seq_length
+                },
+                f,
+                indent=2
+            )
+        logger.info(f"Kaydedildi: {meta_path}")
+
+        return output_path
+
+
+def main():
+    """Ana fonksiyon"""
+    parser = argparse.ArgumentParser(
+        description='Keras modelini int8 TFLite modeline dönüştürür'
+    )
+    parser.add_argument(
+        '--artifacts-dir',
+        type=str,
+        default='../artifacts',
+        help='Model dosyalarının bulunduğu dizin (default: ../artifacts)'
+    )
+    parser.add_argument(
+        '--seq-length',
+        type=int,
+        default=40,
+        help='Girdi sequence uzunluğu (default: 40)'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        exporter = TFLiteExporter(args.artifacts_dir, args.seq_length)
+        exporter.convert()
+    except Exception as e:
+        logger.error(f"Hata oluştu: {e}", exc_info=True)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -16,8 +16,10 @@ import json
 import argparse
 import logging
 from pathlib import Path
-from typing import Tuple, List, Dict
-import pickle
+from typing import Tuple, Dict
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 # Logging yapılandırması
 logging.basicConfig(
@@ -26,6 +28,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# clean_text'in tuttuğu karakterler: harfler, rakamlar, boşluklar ve temel noktalama
+ALLOWED_CHARS = re.compile(r"[a-z0-9\s.,;:!?'\n]")
+# latin-1 aralığında izin verilmeyen byte'lar; bytes.translate ile tek geçişte silinir
+DELETE_BYTES = bytes(i for i in range(256) if not ALLOWED_CHARS.fullmatch(chr(i)))
+
 
 class TextPreprocessor:
     """Metin ön işleme sınıfı"""
@@ -89,7 +96,12 @@ class TextPreprocessor:
             Temizlenmiş metin
         """
         # Sadece harfler, rakamlar ve temel noktalama işaretleri
-        cleaned_text = re.sub(r"[^a-z0-9\s.,;:!?'\n]", "", text)
+        # (latin-1 dışı karakterler encode'da düşer, kalanlar C seviyesinde silinir)
+        cleaned_text = (
+            text.encode("latin-1", "ignore")
+            .translate(None, DELETE_BYTES)
+            .decode("latin-1")
+        )
         logger.info(f"Temizleme sonrası metin uzunluğu: {len(cleaned_text)} karakter")
         return cleaned_text
     
@@ -113,24 +125,38 @@ class TextPreprocessor:
         text: str, 
         sequence_length: int = 40, 
         step: int = 3
-    ) -> Tuple[List[str], List[str]]:
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
         Metinden eğitim sequence'leri oluşturur
         
+        Metin bir kez karakter index'lerine çevrilir; pencereler Python döngüsü
+        yerine stride tricks ile kopyasız bir view olarak çıkarılır.
+        
         Args:
             text: İşlenecek metin
             sequence_length: Her sequence'in uzunluğu
             step: Sliding window adım boyutu
             
         Returns:
-            (input_sequences, target_chars) tuple'ı
+            (input_sequences, target_indices) tuple'ı:
+            (N, sequence_length) ve (N,) boyutlu karakter index dizileri
         """
-        sentences = []
-        next_chars = []
+        # Vocabulary sıralı olduğu için kod noktası -> index lookup tablosu kurulur
+        index_dtype = np.min_scalar_type(max(self.vocab_size - 1, 0))
+        vocab_codes = np.array([ord(ch) for ch in self.char_to_idx], dtype=np.uint32)
+        lut = np.zeros(int(vocab_codes.max()) + 1 if len(vocab_codes) else 1, dtype=index_dtype)
+        lut[vocab_codes] = [self.char_to_idx[ch] for ch in self.char_to_idx]
         
-        for i in range(0, len(text) - sequence_length, step):
-            sentences.append(text[i:i + sequence_length])
-            next_chars.append(text[i + sequence_length])
+        codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+        encoded = lut[codes]
+        
+        if len(encoded) <= sequence_length:
+            sentences = np.empty((0, sequence_length), dtype=index_dtype)
+            next_chars = np.empty(0, dtype=index_dtype)
+        else:
+            # i = 0, step, ... < len - sequence_length için pencere ve hedef karakter
+            sentences = sliding_window_view(encoded, sequence_length)[:-1:step]
+            next_chars = encoded[sequence_length::step]
         
         logger.info(f"Oluşturulan sequence sayısı: {len(sentences)}")
         logger.info(f"Sequence uzunluğu: {sequence_length}")
@@ -140,15 +166,15 @@ class TextPreprocessor:
     
     def save_artifacts(
         self, 
-        sentences: List[str], 
-        next_chars: List[str]
+        sentences: np.ndarray, 
+        next_chars: np.ndarray
     ) -> None:
         """
         İşlenmiş verileri ve vocabulary'yi kaydeder
         
         Args:
-            sentences: Input sequence'leri
-            next_chars: Target karakterler
+            sentences: (N, sequence_length) input sequence index'leri
+            next_chars: (N,) target karakter index'leri
         """
         self.artifacts_dir.mkdir(parents=True, exist_ok=True)
         
@@ -166,23 +192,40 @@ class TextPreprocessor:
             json.dump(idx_to_char_str, f, ensure_ascii=False, indent=2)
         logger.info(f"Kaydedildi: {idx_to_char_path}")
         
-        # Preprocessed sequence'leri kaydet
-        sequences_path = self.artifacts_dir / "sequences.pkl"
-        with open(sequences_path, "wb") as f:
-            pickle.dump({
-                'sentences': sentences,
-                'next_chars': next_chars,
-                'vocab_size': self.vocab_size
-            }, f)
+        # Üretim tarafı için vocabulary'yi parse gerektirmeyen tek dosyaya da kaydet:
+        # 256 girişli byte -> index LUT ve index -> karakter byte dizisi
+        chars = "".join(self.idx_to_char[i] for i in range(self.vocab_size))
+        if self.vocab_size <= 256 and all(ord(ch) < 256 for ch in chars):
+            vocab_path = self.artifacts_dir / "vocab.npz"
+            lut = np.zeros(256, dtype=np.uint8)
+            for ch, i in self.char_to_idx.items():
+                lut[ord(ch)] = i
+            np.savez(
+                vocab_path,
+                lut=lut,
+                idx2char=np.frombuffer(chars.encode("latin-1"), dtype=np.uint8)
+            )
+            logger.info(f"Kaydedildi: {vocab_path}")
+        else:
+            logger.warning("Vocabulary latin-1 dışı karakter içeriyor, vocab.npz atlandı")
+        
+        # Preprocessed sequence'leri index dizileri olarak sıkıştırılmış tek dosyaya kaydet
+        sequences_path = self.artifacts_dir / "sequences.npz"
+        np.savez_compressed(
+            sequences_path,
+            X=np.ascontiguousarray(sentences),
+            y=next_chars,
+            vocab_size=self.vocab_size
+        )
         logger.info(f"Kaydedildi: {sequences_path}")
         
         # Özet bilgileri kaydet
         summary_path = self.artifacts_dir / "preprocessing_summary.json"
         summary = {
             'vocab_size': self.vocab_size,
-            'num_sequences': len(sentences),
-            'sequence_length': len(sentences[0]) if sentences else 0,
-            'total_chars': sum(len(s) for s in sentences) + len(next_chars)
+            'num_sequences': int(sentences.shape[0]),
+            'sequence_length': int(sentences.shape[1]) if len(sentences) else 0,
+            'total_chars': int(sentences.size + next_chars.size)
         }
         with open(summary_path, "w", encoding="utf-8") as f:
             json.dump(summary, f, indent=2)